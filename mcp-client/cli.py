@@ -3,18 +3,77 @@ Command-line interface for MCP Client testing.
 """
 
 import asyncio
+import itertools
 import json
+import queue
 import sys
+import threading
+from typing import Any, Dict, Optional, Tuple
 from client.core import MCPClient, MCPServerConfig
 from client.health.monitor import HealthMonitor
 
 
+CALL_USAGE = "Usage: call <server> <tool> [json-args] [> file | >> file] [&]"
+
+
+def parse_call(line: str) -> Tuple[str, str, Dict[str, Any], bool, Optional[str], str]:
+    """Split a ``call`` command into server, tool, arguments and job options.
+    
+    Syntax: ``call <server> <tool> [json-args] [> file | >> file] [&]``
+    The JSON object is decoded first, so ``>`` or ``&`` inside it are left alone.
+    Returns (server, tool, arguments, background, output_path, output_mode).
+    """
+    parts = line.strip().split(maxsplit=3)
+    if len(parts) < 3:
+        raise ValueError(CALL_USAGE)
+    
+    server_name, tool_name = parts[1], parts[2]
+    rest = parts[3] if len(parts) > 3 else ""
+    
+    arguments: Dict[str, Any] = {}
+    if rest.startswith("{"):
+        arguments, end = json.JSONDecoder().raw_decode(rest)
+        rest = rest[end:]
+    rest = rest.strip()
+    
+    background = rest.endswith("&")
+    if background:
+        rest = rest[:-1].rstrip()
+    elif tool_name.endswith("&") and not rest:
+        background, tool_name = True, tool_name[:-1]
+    
+    output_path, output_mode = None, "w"
+    if rest.startswith(">"):
+        output_mode = "a" if rest.startswith(">>") else "w"
+        output_path = rest.lstrip(">").strip()
+        if not output_path:
+            raise ValueError(CALL_USAGE)
+    elif rest:
+        raise ValueError("Tool arguments must be a JSON object")
+    
+    return server_name, tool_name, arguments, background, output_path, output_mode
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """Render a call_tool result as text."""
+    if not result.get("success"):
+        return f"❌ {result.get('error', 'Unknown error')}"
+    
+    lines = []
+    for content in result.get("result", []):
+        text = getattr(content, "text", None)
+        lines.append(text if text is not None else content.model_dump_json())
+    return "\n".join(lines)
+
+
 class MCPClientCLI:
     """Simple CLI for interacting with MCP Client."""
     
     def __init__(self):
         self.client = MCPClient()
         self.health_monitor = HealthMonitor(self.client)
+        self.jobs: Dict[int, Tuple[str, asyncio.Task]] = {}
+        self._job_ids = itertools.count(1)
     
     async def status(self):
         """Show client status."""
@@ -47,51 +106,205 @@ class MCPClientCLI:
         else:
             print("No tools available (no servers connected)")
     
+    async def connect(self, name: str, command: str, args: list):
+        """Start a stdio server and keep its session open."""
+        config = MCPServerConfig(name=name, command=command, args=args)
+        if await self.client.add_server(config):
+            print(f"✅ Connected to {name}")
+        else:
+            print(f"❌ Failed to connect to {name}")
+    
+    async def call(self, server_name: str, tool_name: str, arguments: Dict[str, Any],
+                   output_path: Optional[str] = None, output_mode: str = "w"):
+        """Call a tool and print the result or write it to a file."""
+        result = await self.client.call_tool(server_name, tool_name, arguments)
+        text = format_result(result)
+        
+        if output_path:
+            with open(output_path, output_mode, encoding="utf-8") as f:
+                f.write(text + "\n")
+            print(f"💾 {tool_name} result written to {output_path}")
+        else:
+            print(text)
+    
+    def start_job(self, description: str, coro) -> int:
+        """Run a coroutine in the background and track it as a job."""
+        job_id = next(self._job_ids)
+        task = asyncio.create_task(coro)
+        self.jobs[job_id] = (description, task)
+        task.add_done_callback(lambda t: self._job_finished(job_id, t))
+        print(f"[{job_id}] started: {description}")
+        return job_id
+    
+    def _job_finished(self, job_id: int, task: asyncio.Task):
+        description, _ = self.jobs[job_id]
+        if task.cancelled():
+            print(f"\n[{job_id}] cancelled: {description}")
+        elif task.exception():
+            print(f"\n[{job_id}] failed: {description}: {task.exception()}")
+        else:
+            print(f"\n[{job_id}] done: {description}")
+    
+    def list_jobs(self):
+        """List background jobs."""
+        if not self.jobs:
+            print("No background jobs")
+            return
+        for job_id, (description, task) in self.jobs.items():
+            if not task.done():
+                state = "running"
+            elif task.cancelled():
+                state = "cancelled"
+            elif task.exception():
+                state = "failed"
+            else:
+                state = "done"
+            print(f"  [{job_id}] {state:9} {description}")
+    
+    def cancel_job(self, job_id: int):
+        """Cancel a running background job."""
+        job = self.jobs.get(job_id)
+        if not job:
+            print(f"No such job: {job_id}")
+        elif job[1].done():
+            print(f"Job {job_id} already finished")
+        else:
+            job[1].cancel()
+    
+    async def shutdown(self):
+        """Cancel outstanding jobs and disconnect servers."""
+        for _, task in self.jobs.values():
+            task.cancel()
+        await asyncio.gather(*(task for _, task in self.jobs.values()), return_exceptions=True)
+        await self.client.disconnect_all()
+    
     def help(self):
         """Show help message."""
         print("""
 MCP Client CLI Commands:
-  status  - Show connection status
-  health  - Show health check results
-  ping    - Ping all servers (or specify server name)
-  tools   - List available tools
-  help    - Show this help message
-  exit    - Exit the CLI
+  status                          - Show connection status
+  health                          - Show health check results
+  ping <server>                   - Ping a server
+  tools [server]                  - List available tools
+  connect <name> <command> [args] - Start and connect to a stdio server
+  call <server> <tool> [json]     - Call a tool
+       ... > file / >> file       -   write (append) the result to a file
+       ... &                      -   run in the background
+  jobs                            - List background jobs
+  cancel <job>                    - Cancel a background job
+  help                            - Show this help message
+  exit                            - Exit the CLI
         """)
 
 
+class StdinReader:
+    """Reads stdin on a daemon thread so the event loop never blocks on input().
+    
+    The thread only calls input() when a line is requested, and being a daemon
+    it never keeps the process alive once the event loop has finished.
+    """
+    
+    def __init__(self):
+        self._requests: "queue.Queue[Tuple[str, asyncio.Future]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+    
+    async def readline(self, prompt: str) -> str:
+        """Prompt for a line; raises EOFError at end of input."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="stdin-reader", daemon=True)
+            self._thread.start()
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._requests.put((prompt, future))
+        return await future
+    
+    def _run(self):
+        while True:
+            prompt, future = self._requests.get()
+            loop = future.get_loop()
+            try:
+                line = input(prompt)
+            except EOFError as e:
+                deliver, value = future.set_exception, e
+            else:
+                deliver, value = future.set_result, line
+            
+            def resolve(deliver=deliver, value=value, future=future):
+                if not future.done():
+                    deliver(value)
+            
+            try:
+                loop.call_soon_threadsafe(resolve)
+            except RuntimeError:
+                return
+
+
 async def interactive_mode():
     """Run interactive CLI mode."""
     cli = MCPClientCLI()
+    stdin = StdinReader()
     
     print("🚀 MCP Client CLI")
     print("Type 'help' for commands, 'exit' to quit")
     
+    try:
+        await repl(cli, stdin)
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\nGoodbye!")
+        raise
+    finally:
+        await cli.shutdown()
+
+
+async def repl(cli: MCPClientCLI, stdin: StdinReader):
+    """Read and dispatch commands until exit or end of input."""
     while True:
         try:
-            command = input("\nmcp> ").strip().lower()
+            line = (await stdin.readline("\nmcp> ")).strip()
+            parts = line.split()
+            command = parts[0].lower() if parts else ""
             
-            if command == "exit":
+            if not command:
+                continue
+            elif command == "exit":
                 break
             elif command == "status":
                 await cli.status()
             elif command == "health":
                 await cli.health()
-            elif command.startswith("ping"):
-                parts = command.split()
-                server_name = parts[1] if len(parts) > 1 else None
-                if server_name:
-                    await cli.ping(server_name)
+            elif command == "ping":
+                if len(parts) > 1:
+                    await cli.ping(parts[1])
                 else:
                     print("Usage: ping <server_name>")
             elif command == "tools":
-                await cli.tools()
+                await cli.tools(parts[1] if len(parts) > 1 else None)
+            elif command == "connect":
+                if len(parts) > 2:
+                    await cli.connect(parts[1], parts[2], parts[3:])
+                else:
+                    print("Usage: connect <name> <command> [args...]")
+            elif command == "call":
+                server_name, tool_name, arguments, background, output_path, output_mode = parse_call(line)
+                call = cli.call(server_name, tool_name, arguments, output_path, output_mode)
+                if background:
+                    cli.start_job(f"call {server_name} {tool_name}", call)
+                else:
+                    await call
+            elif command == "jobs":
+                cli.list_jobs()
+            elif command == "cancel":
+                if len(parts) > 1 and parts[1].isdigit():
+                    cli.cancel_job(int(parts[1]))
+                else:
+                    print("Usage: cancel <job_id>")
             elif command == "help":
                 cli.help()
             else:
                 print("Unknown command. Type 'help' for available commands.")
-                
-        except KeyboardInterrupt:
+        
+        except EOFError:
             print("\nGoodbye!")
             break
         except Exception as e:
@@ -120,4 +333,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
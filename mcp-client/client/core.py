@@ -4,12 +4,24 @@ MCP Client - Core client implementation for Model Context Protocol.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Any
+from dataclasses import dataclass, field
 
 from mcp import ClientSession, StdioServerParameters  
 from mcp.client.stdio import stdio_client
-from mcp.types import CallToolRequest, ListToolsRequest, Tool
+from mcp.types import (
+    CallToolRequest,
+    CallToolRequestParams,
+    CallToolResult,
+    CancelledNotification,
+    CancelledNotificationParams,
+    ClientNotification,
+    ClientRequest,
+    Tool,
+)
+
+from client.hedging.policy import HedgePolicy
+from client.tracing.tracer import Tracer, trace_env, tracer_from_env
 
 
 @dataclass
@@ -19,31 +31,287 @@ class MCPServerConfig:
     command: str
     args: List[str]
     env: Optional[Dict[str, str]] = None
+    auto_restart: bool = True
+    hot_standby: bool = False
+    max_restart_backoff: float = 30.0
+    max_restart_attempts: Optional[int] = 10
+    hedged_tools: List[str] = field(default_factory=list)
+
+
+class _ManagedSession:
+    """A server process and its initialized session, owned by a background task.
+    
+    The stdio transport has to be entered and exited in the same task, so the
+    session lives for as long as ``_run`` keeps its context managers open.
+    """
+    
+    def __init__(self, config: MCPServerConfig, supervisor: "ServerSupervisor"):
+        self.config = config
+        self.supervisor = supervisor
+        self.session: Optional[ClientSession] = None
+        self.ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.stable_timer: Optional[asyncio.TimerHandle] = None
+        self._stopping = False
+        self._wake = asyncio.Event()
+        self.task = asyncio.create_task(self._run(), name=f"mcp-session-{config.name}")
+    
+    async def _run(self):
+        error: Optional[BaseException] = None
+        try:
+            server_params = StdioServerParameters(
+                command=self.config.command,
+                args=self.config.args,
+                env={**trace_env(), **(self.config.env or {})}
+            )
+            
+            async with stdio_client(server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self.session = session
+                    self.ready.set_result(session)
+                    error = await self._watch(session)
+                    
+        except Exception as e:
+            error = e
+        finally:
+            self.session = None
+            if self.stable_timer:
+                self.stable_timer.cancel()
+            if not self.ready.done():
+                self.ready.set_exception(error or ConnectionError("Server exited during startup"))
+        
+        if not self._stopping:
+            self.supervisor._on_session_exit(self, error)
+    
+    async def _watch(self, session: ClientSession) -> Optional[Exception]:
+        """Probe the session until it stops answering or we are asked to stop."""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.supervisor.probe_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            
+            if self._stopping:
+                return None
+            
+            try:
+                await asyncio.wait_for(session.send_ping(), self.supervisor.probe_timeout)
+            except Exception as e:
+                return e
+        
+        return None
+    
+    def probe(self):
+        """Probe the session now instead of waiting for the next interval."""
+        self._wake.set()
+    
+    async def stop(self):
+        """Shut down the session and its server process."""
+        self._stopping = True
+        self._wake.set()
+        if not self.ready.done():
+            self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+
+class ServerSupervisor:
+    """Keeps stdio servers alive, restarting them with backoff.
+    
+    Failed spawns and crashes count as consecutive failures per server; each
+    one doubles the delay before the next restart, up to ``max_restart_attempts``.
+    The count is reset once a session has stayed up for ``stable_uptime``.
+    
+    Servers with ``hot_standby`` set get a second, pre-initialized session that
+    is promoted immediately when the primary dies.
+    """
+    
+    def __init__(self, client: "MCPClient", probe_interval: float = 15.0,
+                 probe_timeout: float = 5.0, restart_backoff: float = 0.5,
+                 stable_uptime: float = 60.0):
+        self.client = client
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.restart_backoff = restart_backoff
+        self.stable_uptime = stable_uptime
+        self.primaries: Dict[str, _ManagedSession] = {}
+        self.standbys: Dict[str, _ManagedSession] = {}
+        self.restart_counts: Dict[str, int] = {}
+        self.failure_counts: Dict[str, int] = {}
+        self._restart_tasks: Dict[str, asyncio.Task] = {}
+        self._listeners: List[Callable[[str, str, Dict[str, Any]], None]] = []
+        self.logger = logging.getLogger(__name__)
+    
+    def subscribe(self, listener: Callable[[str, str, Dict[str, Any]], None]):
+        """Register a callback for (server_name, event, details) notifications."""
+        self._listeners.append(listener)
+    
+    def _emit(self, server_name: str, event: str, **details: Any):
+        level = logging.ERROR if event in ("restart_failed", "gave_up") else logging.INFO
+        self.logger.log(level, f"{server_name}: {event} {details or ''}")
+        for listener in self._listeners:
+            try:
+                listener(server_name, event, details)
+            except Exception as e:
+                self.logger.error(f"Supervisor listener failed: {e}")
+    
+    async def start(self, config: MCPServerConfig) -> ClientSession:
+        """Start a supervised server and wait for its session to initialize."""
+        await self.stop(config.name)
+        self.failure_counts.pop(config.name, None)
+        
+        managed = _ManagedSession(config, self)
+        try:
+            session = await managed.ready
+        except BaseException:
+            await managed.stop()
+            raise
+        
+        self._watch_stability(managed)
+        self.primaries[config.name] = managed
+        self.client.sessions[config.name] = session
+        
+        if config.hot_standby:
+            self._schedule_restart(config, standby=True, attempt=0)
+        
+        return session
+    
+    def is_restarting(self, server_name: str) -> bool:
+        """Whether a restart of the primary session is pending."""
+        task = self._restart_tasks.get(server_name)
+        return task is not None and not task.done()
+    
+    def probe(self, server_name: str):
+        """Ask the supervisor to check a server right away, e.g. after a failed call."""
+        managed = self.primaries.get(server_name)
+        if managed:
+            managed.probe()
+    
+    def _watch_stability(self, managed: _ManagedSession):
+        """Reset the server's failure count once this session has stayed up long enough."""
+        def reset():
+            if managed.session is not None:
+                self.failure_counts.pop(managed.config.name, None)
+        
+        managed.stable_timer = asyncio.get_running_loop().call_later(self.stable_uptime, reset)
+    
+    def _record_failure(self, config: MCPServerConfig, standby: bool) -> Optional[int]:
+        """Count a consecutive failure; returns None once restarts should stop."""
+        failures = self.failure_counts.get(config.name, 0) + 1
+        self.failure_counts[config.name] = failures
+        if config.max_restart_attempts is not None and failures >= config.max_restart_attempts:
+            self._emit(config.name, "gave_up", attempts=failures, standby=standby)
+            return None
+        return failures
+    
+    def _on_session_exit(self, managed: _ManagedSession, error: Optional[BaseException]):
+        name = managed.config.name
+        
+        if self.standbys.get(name) is managed:
+            del self.standbys[name]
+            self._emit(name, "standby_lost", error=str(error))
+            failures = self._record_failure(managed.config, standby=True)
+            if failures is not None:
+                self._schedule_restart(managed.config, standby=True, attempt=failures)
+            return
+        
+        if self.primaries.get(name) is not managed:
+            return
+        
+        del self.primaries[name]
+        self.client.sessions.pop(name, None)
+        
+        standby = self.standbys.pop(name, None)
+        if standby and standby.session is not None:
+            self.primaries[name] = standby
+            self.client.sessions[name] = standby.session
+            self._emit(name, "failover", error=str(error))
+            failures = self._record_failure(managed.config, standby=True)
+            if failures is not None:
+                self._schedule_restart(managed.config, standby=True, attempt=failures)
+        elif managed.config.auto_restart:
+            self._emit(name, "crashed", error=str(error))
+            failures = self._record_failure(managed.config, standby=False)
+            if failures is not None:
+                self._schedule_restart(managed.config, standby=False, attempt=failures)
+        else:
+            self._emit(name, "stopped", error=str(error))
+    
+    def _schedule_restart(self, config: MCPServerConfig, standby: bool, attempt: int):
+        key = f"{config.name}:standby" if standby else config.name
+        task = self._restart_tasks.get(key)
+        if task and not task.done():
+            return
+        self._restart_tasks[key] = asyncio.create_task(self._restart(config, standby, attempt))
+    
+    async def _restart(self, config: MCPServerConfig, standby: bool, attempt: int):
+        """Spawn a session after backing off for ``attempt`` consecutive failures."""
+        name = config.name
+        while True:
+            if attempt:
+                delay = min(self.restart_backoff * 2 ** (attempt - 1), config.max_restart_backoff)
+                await asyncio.sleep(delay)
+            
+            managed = _ManagedSession(config, self)
+            try:
+                session = await managed.ready
+            except Exception as e:
+                self._emit(name, "restart_failed", attempt=attempt + 1, standby=standby, error=str(e))
+                attempt = self._record_failure(config, standby)
+                if attempt is None:
+                    return
+                continue
+            
+            self._watch_stability(managed)
+            if standby:
+                self.standbys[name] = managed
+                self._emit(name, "standby_ready", attempt=attempt + 1)
+            else:
+                self.primaries[name] = managed
+                self.client.sessions[name] = session
+                self.restart_counts[name] = self.restart_counts.get(name, 0) + 1
+                self._emit(name, "restarted", attempt=attempt + 1)
+                if config.hot_standby and name not in self.standbys:
+                    self._schedule_restart(config, standby=True, attempt=0)
+            return
+    
+    async def stop(self, server_name: str):
+        """Stop a server, its standby and any pending restarts."""
+        for key in (server_name, f"{server_name}:standby"):
+            task = self._restart_tasks.pop(key, None)
+            if task:
+                task.cancel()
+        
+        for managed in (self.primaries.pop(server_name, None), self.standbys.pop(server_name, None)):
+            if managed:
+                await managed.stop()
+        
+        self.client.sessions.pop(server_name, None)
+    
+    async def stop_all(self):
+        """Stop every supervised server."""
+        for name in set(self.primaries) | set(self.standbys) | {k.split(":")[0] for k in self._restart_tasks}:
+            await self.stop(name)
 
 
 class MCPClient:
     """Core MCP Client for managing server connections and tool execution."""
     
-    def __init__(self):
+    def __init__(self, tracer: Optional[Tracer] = None, hedging: Optional[HedgePolicy] = None):
         self.sessions: Dict[str, ClientSession] = {}
         self.server_configs: Dict[str, MCPServerConfig] = {}
         self.logger = logging.getLogger(__name__)
+        self.supervisor = ServerSupervisor(self)
+        self.tracer = tracer or tracer_from_env("mcp-client")
+        self.hedging = hedging or HedgePolicy()
+        self._notifications: set = set()
         
     async def add_server(self, config: MCPServerConfig) -> bool:
-        """Connect to an MCP server."""
+        """Connect to an MCP server and keep it supervised."""
         try:
-            server_params = StdioServerParameters(
-                command=config.command,
-                args=config.args,
-                env=config.env or {}
-            )
-            
-            async with stdio_client(server_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    self.sessions[config.name] = session
-                    self.server_configs[config.name] = config
-                    return True
+            await self.supervisor.start(config)
+            self.server_configs[config.name] = config
+            return True
                     
         except Exception as e:
             self.logger.error(f"Failed to connect to {config.name}: {e}")
@@ -58,8 +326,7 @@ class MCPClient:
             if name in self.sessions:
                 try:
                     session = self.sessions[name]
-                    request = ListToolsRequest()
-                    response = await session.list_tools(request)
+                    response = await session.list_tools()
                     tools_by_server[name] = response.tools
                 except Exception as e:
                     self.logger.error(f"Failed to list tools for {name}: {e}")
@@ -68,25 +335,94 @@ class MCPClient:
         return tools_by_server
     
     async def call_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Call a tool on a specific server."""
+        """Call a tool on a specific server.
+        
+        Tool results flagged with ``isError`` come back with ``success: False``,
+        ``isError: True`` and the tool's error text, alongside the raw content.
+        """
         if server_name not in self.sessions:
             return {"error": f"Server {server_name} not connected"}
         
+        with self.tracer.span("mcp.call_tool", {"mcp.server": server_name, "mcp.tool": tool_name}) as span:
+            try:
+                session = self.sessions[server_name]
+                config = self.server_configs.get(server_name)
+                
+                if config and tool_name in config.hedged_tools:
+                    response = await self._hedged_call_tool(server_name, session, tool_name, arguments)
+                else:
+                    response = await self._send_call_tool(session, tool_name, arguments)
+                
+                if response.isError:
+                    span.record_error("tool returned an error")
+                    texts = [content.text for content in response.content if getattr(content, "text", None)]
+                    return {
+                        "success": False,
+                        "isError": True,
+                        "error": "\n".join(texts) or "Tool returned an error",
+                        "result": response.content
+                    }
+                return {
+                    "success": True,
+                    "result": response.content
+                }
+                
+            except Exception as e:
+                span.record_error(e)
+                self.supervisor.probe(server_name)
+                return {
+                    "success": False,
+                    "error": str(e)
+                }
+    
+    async def _hedged_call_tool(self, server_name: str, session: ClientSession, tool_name: str,
+                                arguments: Dict[str, Any]) -> CallToolResult:
+        """Call an idempotent tool, hedging on the hot standby session.
+        
+        A duplicate on the same session shares the same pipe and process, so
+        without a standby the call is sent once and counted as ``no_backup``.
+        """
+        standby = self.supervisor.standbys.get(server_name)
+        backup_session = standby.session if standby else None
+        if backup_session is None or backup_session is session:
+            self.hedging.no_backup += 1
+            return await self._send_call_tool(session, tool_name, arguments)
+        
+        return await self.hedging.run(
+            (server_name, tool_name),
+            lambda: self._send_call_tool(session, tool_name, arguments),
+            lambda: self._send_call_tool(backup_session, tool_name, arguments)
+        )
+    
+    async def _send_call_tool(self, session: ClientSession, tool_name: str,
+                              arguments: Dict[str, Any]) -> CallToolResult:
+        """Send tools/call with the current trace context in ``_meta``.
+        
+        If the call is cancelled (e.g. it lost a hedge), the server is sent
+        ``notifications/cancelled`` so it stops working on the request too.
+        """
+        request = CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name=tool_name, arguments=arguments, _meta=self.tracer.inject())
+        )
+        # mcp has no public way to learn a request's id; send_request allocates
+        # _request_id synchronously before its first await (mcp is pinned to 1.9.x)
+        request_id = session._request_id
         try:
-            session = self.sessions[server_name]
-            request = CallToolRequest(name=tool_name, arguments=arguments)
-            response = await session.call_tool(request)
-            
-            return {
-                "success": True,
-                "result": response.content
-            }
-            
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return await session.send_request(ClientRequest(request), CallToolResult)
+        except asyncio.CancelledError:
+            self._notify_cancelled(session, request_id)
+            raise
+    
+    def _notify_cancelled(self, session: ClientSession, request_id: int):
+        """Tell a server to stop processing a request we no longer wait for."""
+        notification = CancelledNotification(
+            method="notifications/cancelled",
+            params=CancelledNotificationParams(requestId=request_id, reason="Request cancelled by client")
+        )
+        task = asyncio.create_task(session.send_notification(ClientNotification(notification)))
+        self._notifications.add(task)
+        task.add_done_callback(self._notifications.discard)
     
     def get_connected_servers(self) -> List[str]:
         """Get list of connected server names."""
@@ -94,5 +430,7 @@ class MCPClient:
     
     async def disconnect_all(self):
         """Disconnect from all servers."""
+        await self.supervisor.stop_all()
         self.sessions.clear()
         self.server_configs.clear()
+        await self.tracer.shutdown()
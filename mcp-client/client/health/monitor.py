@@ -3,39 +3,54 @@ Health monitoring and ping functionality for MCP Client.
 """
 
 import asyncio
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any
-from mcp.types import ListToolsRequest
+from typing import Deque, Dict, Any
 
 
 class HealthMonitor:
     """Handles health checks and ping operations for MCP servers."""
     
-    def __init__(self, client):
+    def __init__(self, client, max_events: int = 100):
         self.client = client
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self.event_counts: Dict[str, Dict[str, int]] = {}
+        client.supervisor.subscribe(self.record_event)
+    
+    def record_event(self, server_name: str, event: str, details: Dict[str, Any]):
+        """Record a supervisor event such as a restart or failover."""
+        self.events.append({
+            "server": server_name,
+            "event": event,
+            "timestamp": datetime.now().isoformat(),
+            **details
+        })
+        counts = self.event_counts.setdefault(server_name, {})
+        counts[event] = counts.get(event, 0) + 1
     
     async def ping_server(self, server_name: str) -> Dict[str, Any]:
         """Ping a specific MCP server to check its health."""
         timestamp = datetime.now().isoformat()
         
         if server_name not in self.client.sessions:
+            restarting = self.client.supervisor.is_restarting(server_name)
             return {
                 "server": server_name,
-                "status": "not_connected",
+                "status": "restarting" if restarting else "not_connected",
                 "timestamp": timestamp,
                 "error": "Server not found or not connected"
             }
         
         try:
             session = self.client.sessions[server_name]
-            tools_request = ListToolsRequest()
-            tools_response = await session.list_tools(tools_request)
+            tools_response = await session.list_tools()
             
             return {
                 "server": server_name,
                 "status": "healthy",
                 "timestamp": timestamp,
-                "tools_count": len(tools_response.tools)
+                "tools_count": len(tools_response.tools),
+                "events": self.event_counts.get(server_name, {})
             }
             
         except Exception as e:
@@ -56,7 +71,9 @@ class HealthMonitor:
                 "total_servers": len(self.client.sessions),
                 "healthy_servers": 0,
                 "unhealthy_servers": 0
-            }
+            },
+            "recent_events": list(self.events)[-10:],
+            "hedging": self.client.hedging.stats()
         }
         
         for server_name in self.client.sessions.keys():
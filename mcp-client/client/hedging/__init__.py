@@ -0,0 +1 @@
+# Request hedging package
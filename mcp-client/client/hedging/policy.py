@@ -0,0 +1,114 @@
+"""
+Hedged requests for idempotent operations.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """Sends a backup request when the first one is slower than usual.
+    
+    The hedge delay adapts per key to the ``quantile`` of recent primary
+    latencies (``default_delay`` until ``min_samples`` are seen). Hedges are
+    capped at ``budget`` times the last ``window`` requests, so extra load
+    stays bounded even after a long quiet period.
+    """
+    
+    def __init__(self, quantile: float = 0.95, budget: float = 0.1, default_delay: float = 1.0,
+                 min_delay: float = 0.01, window: int = 200, min_samples: int = 20):
+        self.quantile = quantile
+        self.budget = budget
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.window = window
+        self.min_samples = min_samples
+        self._latencies: Dict[Hashable, Deque[float]] = {}
+        self._recent_hedges: Deque[int] = deque()
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+        self.no_backup = 0
+    
+    def delay(self, key: Hashable) -> float:
+        """Seconds to wait before hedging a request for ``key``."""
+        samples = self._latencies.get(key)
+        if not samples or len(samples) < self.min_samples:
+            return self.default_delay
+        ordered = sorted(samples)
+        return max(ordered[int(self.quantile * (len(ordered) - 1))], self.min_delay)
+    
+    def _within_budget(self) -> bool:
+        """Whether another hedge fits in the budget for the last ``window`` requests."""
+        horizon = self.requests - self.window
+        while self._recent_hedges and self._recent_hedges[0] <= horizon:
+            self._recent_hedges.popleft()
+        return len(self._recent_hedges) < self.budget * min(self.requests, self.window)
+    
+    def record(self, key: Hashable, seconds: float):
+        """Record an observed latency for ``key``."""
+        samples = self._latencies.get(key)
+        if samples is None:
+            samples = self._latencies[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+    
+    async def run(self, key: Hashable, primary: Callable[[], Awaitable[T]],
+                  backup: Optional[Callable[[], Awaitable[T]]] = None,
+                  can_hedge: Optional[Callable[[], bool]] = None) -> T:
+        """Run ``primary``, racing ``backup`` (default: ``primary`` again) if it is slow.
+        
+        The first successful response wins and the other request is cancelled.
+        If both fail, the primary's exception is raised. A ``can_hedge`` check
+        returning False (e.g. no spare capacity) counts as ``budget_denied``.
+        
+        Only the primary's latency is recorded; if the backup wins, that is
+        how long the primary had been running when it was cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self.requests += 1
+        
+        first = asyncio.ensure_future(primary())
+        pending = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.delay(key))
+            
+            if not done:
+                if self._within_budget() and (can_hedge is None or can_hedge()):
+                    self.hedged += 1
+                    self._recent_hedges.append(self.requests)
+                    pending.add(asyncio.ensure_future((backup or primary)()))
+                else:
+                    self.budget_denied += 1
+            
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if first in done and first.exception() is None:
+                    self.record(key, loop.time() - start)
+                    return first.result()
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None:
+                    self.hedge_wins += 1
+                    if first in pending:
+                        self.record(key, loop.time() - start)
+                    return winner.result()
+            
+            return first.result()
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hedging counters."""
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "budget_denied": self.budget_denied,
+            "no_backup": self.no_backup
+        }
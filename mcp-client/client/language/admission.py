@@ -0,0 +1,78 @@
+"""Admission control for upstream language API requests."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+
+class OverloadedError(Exception):
+    """Raised when a request cannot be admitted in time."""
+
+
+class AdmissionController:
+    """Bounds in-flight upstream requests and the queue waiting for them.
+    
+    Requests beyond ``max_in_flight`` wait in a queue of at most ``max_queue``
+    entries for up to ``max_queue_time`` seconds. Anything beyond that fails
+    fast with ``OverloadedError`` instead of piling up.
+    """
+    
+    def __init__(self, max_in_flight: int = 8, max_queue: int = 32, max_queue_time: float = 2.0):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.max_queue_time = max_queue_time
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+    
+    def has_free_slot(self) -> bool:
+        """Whether a slot can be taken right now without queueing."""
+        return not self._slots.locked()
+    
+    @asynccontextmanager
+    async def slot(self, wait: bool = True) -> AsyncIterator[None]:
+        """Hold an upstream request slot for the duration of the block.
+        
+        With ``wait=False`` the request never queues: it fails with
+        ``OverloadedError`` unless a slot is free right now.
+        """
+        if self._slots.locked():
+            if not wait:
+                raise OverloadedError("no free slot")
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise OverloadedError(f"queue full ({self.queued} waiting)")
+            
+            self.queued += 1
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.max_queue_time)
+            except asyncio.TimeoutError:
+                self.timed_out += 1
+                raise OverloadedError(f"queued for more than {self.max_queue_time}s")
+            finally:
+                self.queued -= 1
+        else:
+            await self._slots.acquire()
+        
+        self.in_flight += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Current load and counters."""
+        return {
+            "in_flight": self.in_flight,
+            "queue_depth": self.queued,
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out
+        }
@@ -0,0 +1,39 @@
+"""In-memory result cache for language tools."""
+
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from client.language.models import LanguageResult
+
+
+class ResultCache:
+    """LRU cache whose entries go stale after ``ttl`` seconds.
+    
+    Stale entries are kept until evicted so they can still be served when
+    upstream requests are being shed.
+    """
+    
+    def __init__(self, ttl: float = 3600.0, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, LanguageResult]]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Tuple[LanguageResult, bool]]:
+        """Return ``(result, fresh)`` or None if the key was never cached."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        stored_at, result = entry
+        return result, time.monotonic() - stored_at < self.ttl
+    
+    def put(self, key: Hashable, result: LanguageResult):
+        """Store a result, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
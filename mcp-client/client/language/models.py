@@ -0,0 +1,77 @@
+"""Compact result models for language tools."""
+
+import json
+from dataclasses import dataclass, field, asdict, replace
+from typing import List, Union
+
+STALE_NOTE = "⚠️ Served from cache while the server is overloaded"
+
+
+@dataclass(slots=True)
+class Definition:
+    """A single sense of a word."""
+    part_of_speech: str
+    definition: str
+    example: str = ""
+
+
+@dataclass(slots=True)
+class WordDefinition:
+    """Definition lookup result."""
+    word: str
+    phonetics: List[str] = field(default_factory=list)
+    definitions: List[Definition] = field(default_factory=list)
+    stale: bool = False
+
+    def render(self) -> str:
+        """Render as human-readable text."""
+        lines = [f"📖 Definition for '{self.word}':"]
+        if self.phonetics:
+            lines.append(f"🔊 Pronunciation: {', '.join(self.phonetics)}")
+        for item in self.definitions:
+            lines.append(f"• {item.part_of_speech}: {item.definition}")
+            if item.example:
+                lines.append(f"  Example: {item.example}")
+        if self.stale:
+            lines.append(STALE_NOTE)
+        return "\n".join(lines)
+
+
+@dataclass(slots=True)
+class WordRelations:
+    """Synonym or antonym lookup result."""
+    word: str
+    relation: str
+    words: List[str] = field(default_factory=list)
+    stale: bool = False
+
+    def render(self) -> str:
+        """Render as human-readable text."""
+        icon = "🔄" if self.relation == "synonyms" else "↔️"
+        header = f"{icon} {self.relation.capitalize()} for '{self.word}':"
+        body = f"• {', '.join(self.words)}" if self.words else f"• No {self.relation} found"
+        note = f"\n{STALE_NOTE}" if self.stale else ""
+        return f"{header}\n{body}{note}"
+
+
+@dataclass(slots=True)
+class LanguageToolError:
+    """Error returned instead of a result."""
+    error: str
+
+    def render(self) -> str:
+        """Render as human-readable text."""
+        return f"❌ {self.error}"
+
+
+LanguageResult = Union[WordDefinition, WordRelations, LanguageToolError]
+
+
+def mark_stale(result: LanguageResult) -> LanguageResult:
+    """Copy of a cached result flagged as served stale."""
+    return replace(result, stale=True)
+
+
+def encode(result: LanguageResult) -> str:
+    """Encode a result as compact JSON."""
+    return json.dumps(asdict(result), ensure_ascii=False, separators=(",", ":"))
@@ -2,79 +2,113 @@
 
 import asyncio
 import aiohttp
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+from client.language.models import (
+    Definition,
+    LanguageToolError,
+    WordDefinition,
+    WordRelations,
+)
+from client.hedging.policy import HedgePolicy
+from client.language.admission import AdmissionController
+from client.tracing.tracer import Tracer
 
 
 class LanguageTools:
     """Language learning tools for definitions, synonyms, and antonyms."""
     
-    def __init__(self):
+    def __init__(self, tracer: Optional[Tracer] = None, hedging: Optional[HedgePolicy] = None,
+                 admission: Optional[AdmissionController] = None):
+        self.tracer = tracer or Tracer("language-tools")
+        self.hedging = hedging
+        self.admission = admission
         self.dict_api_base = "https://api.dictionaryapi.dev/api/v2/entries"
         self.datamuse_base = "https://api.datamuse.com/words"
     
-    async def get_definition(self, word: str, language: str = "en") -> Dict[str, Any]:
+    async def get_definition(self, word: str, language: str = "en") -> WordDefinition | LanguageToolError:
         """Get word definition with part of speech and examples."""
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.dict_api_base}/{language}/{word.lower()}"
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._format_definition(data)
-                    else:
-                        return {"error": f"Definition not found for '{word}'"}
+            url = f"{self.dict_api_base}/{language}/{word.lower()}"
+            status, data = await self._get_json(url)
+            if status == 200:
+                return self._format_definition(data)
+            else:
+                return LanguageToolError(f"Definition not found for '{word}'")
         except Exception as e:
-            return {"error": f"API error: {str(e)}"}
+            return LanguageToolError(f"API error: {str(e)}")
     
-    async def get_synonyms(self, word: str, language: str = "en") -> Dict[str, Any]:
+    async def get_synonyms(self, word: str, language: str = "en") -> WordRelations | LanguageToolError:
         """Get synonyms using Datamuse API."""
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.datamuse_base}?rel_syn={word.lower()}&max=10"
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        synonyms = [item['word'] for item in data]
-                        return {"word": word, "synonyms": synonyms}
-                    else:
-                        return {"error": f"Synonyms not found for '{word}'"}
+            url = f"{self.datamuse_base}?rel_syn={word.lower()}&max=10"
+            status, data = await self._get_json(url)
+            if status == 200:
+                return WordRelations(word, "synonyms", [item['word'] for item in data])
+            else:
+                return LanguageToolError(f"Synonyms not found for '{word}'")
         except Exception as e:
-            return {"error": f"API error: {str(e)}"}
+            return LanguageToolError(f"API error: {str(e)}")
     
-    async def get_antonyms(self, word: str, language: str = "en") -> Dict[str, Any]:
+    async def get_antonyms(self, word: str, language: str = "en") -> WordRelations | LanguageToolError:
         """Get antonyms using Datamuse API."""
         try:
+            url = f"{self.datamuse_base}?rel_ant={word.lower()}&max=10"
+            status, data = await self._get_json(url)
+            if status == 200:
+                return WordRelations(word, "antonyms", [item['word'] for item in data])
+            else:
+                return LanguageToolError(f"Antonyms not found for '{word}'")
+        except Exception as e:
+            return LanguageToolError(f"API error: {str(e)}")
+    
+    async def _get_json(self, url: str) -> Tuple[int, Any]:
+        """GET a URL, hedged per API host when hedging is enabled.
+        
+        The caller already holds an admission slot for the first request. A
+        backup request is only sent if another slot is free right now; it
+        never waits in the admission queue ahead of real requests.
+        """
+        if self.hedging is None:
+            return await self._fetch_json(url)
+        if self.admission is None:
+            return await self.hedging.run(url.split("/")[2], lambda: self._fetch_json(url))
+        
+        async def backup() -> Tuple[int, Any]:
+            async with self.admission.slot(wait=False):
+                return await self._fetch_json(url)
+        
+        return await self.hedging.run(url.split("/")[2], lambda: self._fetch_json(url), backup,
+                                      can_hedge=self.admission.has_free_slot)
+    
+    async def _fetch_json(self, url: str) -> Tuple[int, Any]:
+        """GET a URL inside an HTTP span, returning (status, decoded JSON or None)."""
+        with self.tracer.span("http.get", {"http.url": url}) as span:
             async with aiohttp.ClientSession() as session:
-                url = f"{self.datamuse_base}?rel_ant={word.lower()}&max=10"
                 async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        antonyms = [item['word'] for item in data]
-                        return {"word": word, "antonyms": antonyms}
-                    else:
-                        return {"error": f"Antonyms not found for '{word}'"}
-        except Exception as e:
-            return {"error": f"API error: {str(e)}"}
+                    span.set_attribute("http.status_code", response.status)
+                    if response.status != 200:
+                        return response.status, None
+                    return response.status, await response.json()
     
-    def _format_definition(self, data: List[Dict]) -> Dict[str, Any]:
+    def _format_definition(self, data: List[Dict[str, Any]]) -> WordDefinition | LanguageToolError:
         """Format dictionary API response."""
         if not data:
-            return {"error": "No definition found"}
+            return LanguageToolError("No definition found")
         
         entry = data[0]
-        result = {
-            "word": entry.get("word", ""),
-            "phonetics": [p.get("text", "") for p in entry.get("phonetics", []) if p.get("text")],
-            "definitions": []
-        }
-        
-        for meaning in entry.get("meanings", []):
-            part_of_speech = meaning.get("partOfSpeech", "")
-            for definition in meaning.get("definitions", []):
-                result["definitions"].append({
-                    "partOfSpeech": part_of_speech,
-                    "definition": definition.get("definition", ""),
-                    "example": definition.get("example", "")
-                })
+        definitions = [
+            Definition(
+                meaning.get("partOfSpeech", ""),
+                definition.get("definition", ""),
+                definition.get("example", "")
+            )
+            for meaning in entry.get("meanings", [])
+            for definition in meaning.get("definitions", [])
+        ]
         
-        return result
+        return WordDefinition(
+            entry.get("word", ""),
+            [p["text"] for p in entry.get("phonetics", []) if p.get("text")],
+            definitions
+        )
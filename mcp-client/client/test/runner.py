@@ -4,14 +4,27 @@ Simple test runner for MCP Client functionality.
 
 import asyncio
 import json
+import signal
 import sys
 import os
 
 # Add parent directories to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from client.core import MCPClient
+LANGUAGE_SERVER = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "language_server.py"
+)
+
+from client.core import MCPClient, MCPServerConfig
 from client.health.monitor import HealthMonitor
+from client.hedging.policy import HedgePolicy
+from client.language.admission import AdmissionController, OverloadedError
+from client.language.cache import ResultCache
+from client.language.models import WordRelations, LanguageToolError, encode
+from client.language.tools import LanguageTools
+from client.tracing.tracer import OTLPExporter, Tracer, parse_traceparent
+from client.workflow.engine import WorkflowEngine, WorkflowStep, render
 
 
 async def test_client_basics():
@@ -50,10 +63,562 @@ async def test_client_basics():
     return True
 
 
+async def test_language_server_errors():
+    """Test that language server errors are structured and flagged."""
+    print("🧾 Testing Language Server Errors...")
+    
+    client = MCPClient()
+    config = MCPServerConfig(name="language", command=sys.executable, args=[LANGUAGE_SERVER])
+    assert await client.add_server(config)
+    session = client.sessions["language"]
+    
+    # Test 1: Errors come back as JSON with isError set
+    result = await session.call_tool("define", {})
+    assert result.isError
+    assert json.loads(result.content[0].text) == {"error": "Word parameter is required"}
+    result = await session.call_tool("no-such-tool", {"word": "x"})
+    assert result.isError and "Unknown tool" in json.loads(result.content[0].text)["error"]
+    print("✅ JSON errors: Flagged with isError")
+    
+    # Test 2: Text rendering still available for errors
+    result = await session.call_tool("define", {"format": "text"})
+    assert result.isError and result.content[0].text.startswith("❌")
+    print("✅ Text errors: Rendered on request")
+    
+    # Test 3: MCPClient.call_tool reports flagged errors as failures
+    result = await client.call_tool("language", "no-such-tool", {"word": "x"})
+    assert not result["success"] and result["isError"]
+    assert "Unknown tool" in json.loads(result["error"])["error"]
+    result = await client.call_tool("language", "stats", {})
+    assert result["success"] and "isError" not in result
+    print("✅ Client: isError results returned as failures")
+    
+    await client.disconnect_all()
+    print("🎉 All language server error tests passed!")
+    return True
+
+
+def _child_pids():
+    """PIDs of this process's children, oldest first (Linux only)."""
+    pids = []
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            if ppid == os.getpid():
+                pids.append(int(entry))
+    return sorted(pids)
+
+
+async def test_supervisor():
+    """Test server supervision bookkeeping."""
+    print("🛡️ Testing Server Supervisor...")
+    
+    client = MCPClient()
+    health_monitor = HealthMonitor(client)
+    
+    # Test 1: Failed spawn leaves nothing behind
+    config = MCPServerConfig(name="missing", command="/nonexistent/mcp-server", args=[])
+    assert await client.add_server(config) is False
+    assert client.get_connected_servers() == []
+    assert not client.supervisor.is_restarting("missing")
+    print("✅ Failed spawn: No session or restart left behind")
+    
+    # Test 2: Failing restarts are reported and eventually given up
+    config = MCPServerConfig(name="missing", command="/nonexistent/mcp-server", args=[],
+                             max_restart_attempts=2)
+    client.supervisor.restart_backoff = 0.01
+    await client.supervisor._restart(config, standby=False, attempt=0)
+    assert health_monitor.event_counts["missing"] == {"restart_failed": 2, "gave_up": 1}
+    health = await health_monitor.health_check()
+    assert health["recent_events"][-1]["event"] == "gave_up"
+    print("✅ Crash loop: Failed restarts reported, then given up")
+    
+    # Test 3: A server that crashes after initializing is backed off and given up
+    client.supervisor.probe_interval = 0.1
+    crashing = (f"import asyncio, sys; sys.path.insert(0, {os.path.dirname(LANGUAGE_SERVER)!r}); "
+                "import language_server; asyncio.run(asyncio.wait_for(language_server.main(), 0.5))")
+    config = MCPServerConfig(name="crashing", command=sys.executable, args=["-c", crashing],
+                             max_restart_attempts=3)
+    assert await client.add_server(config)
+    for _ in range(200):
+        if health_monitor.event_counts.get("crashing", {}).get("gave_up"):
+            break
+        await asyncio.sleep(0.1)
+    assert health_monitor.event_counts["crashing"] == {"crashed": 3, "restarted": 2, "gave_up": 1}
+    assert client.supervisor.failure_counts["crashing"] == 3
+    assert not client.supervisor.is_restarting("crashing")
+    print("✅ Crash after start: Backed off, then given up")
+    
+    # Test 4: Killing the primary fails over to the hot standby
+    if not os.path.isdir("/proc"):
+        print("⏭️ Failover: Skipped (needs /proc to find the server process)")
+    else:
+        client.supervisor.probe_interval = 0.2
+        client.supervisor.probe_timeout = 1.0
+        client.supervisor.stable_uptime = 0.5
+        config = MCPServerConfig(name="language", command=sys.executable, args=[LANGUAGE_SERVER],
+                                 hot_standby=True)
+        assert await client.add_server(config)
+        primary_pid = _child_pids()[0]
+        
+        async def wait_for(event, count=1):
+            for _ in range(100):
+                if health_monitor.event_counts.get("language", {}).get(event, 0) >= count:
+                    return
+                await asyncio.sleep(0.1)
+            raise AssertionError(f"no {event} event: {health_monitor.event_counts}")
+        
+        await wait_for("standby_ready")
+        os.kill(primary_pid, signal.SIGKILL)
+        await wait_for("failover")
+        result = await client.call_tool("language", "stats", {})
+        assert result["success"] and json.loads(result["result"][0].text)["admitted"] == 0
+        await wait_for("standby_ready", count=2)
+        await asyncio.sleep(0.7)
+        assert "language" not in client.supervisor.failure_counts
+        print("✅ Failover: Standby promoted, a new one started, failures reset once stable")
+    
+    await client.disconnect_all()
+    print("🎉 All supervisor tests passed!")
+    return True
+
+
+async def test_language_models():
+    """Test structured language tool results."""
+    print("📚 Testing Language Models...")
+    
+    tools = LanguageTools()
+    
+    # Test 1: Dictionary payload maps onto compact models
+    result = tools._format_definition([{
+        "word": "hello",
+        "phonetics": [{"text": "/həˈləʊ/"}, {}],
+        "meanings": [{
+            "partOfSpeech": "noun",
+            "definitions": [{"definition": "A greeting.", "example": "She said hello."}]
+        }]
+    }])
+    assert result.phonetics == ["/həˈləʊ/"]
+    assert result.definitions[0].part_of_speech == "noun"
+    print("✅ Definition parsing: Compact models built")
+    
+    # Test 2: JSON encoding round-trips
+    payload = json.loads(encode(result))
+    assert payload["definitions"][0]["example"] == "She said hello."
+    assert json.loads(encode(LanguageToolError("boom"))) == {"error": "boom"}
+    print("✅ JSON encoding: Structured output")
+    
+    # Test 3: Text rendering is still available
+    assert "• noun: A greeting." in result.render()
+    assert WordRelations("big", "antonyms").render().endswith("No antonyms found")
+    print("✅ Text rendering: Human-readable output")
+    
+    print("🎉 All language model tests passed!")
+    return True
+
+
+async def test_admission_control():
+    """Test bounded in-flight requests and load shedding."""
+    print("🚦 Testing Admission Control...")
+    
+    admission = AdmissionController(max_in_flight=1, max_queue=1, max_queue_time=0.05)
+    
+    async def hold(seconds):
+        async with admission.slot():
+            await asyncio.sleep(seconds)
+    
+    # Test 1: Queue overflow fails fast
+    holder = asyncio.create_task(hold(0.2))
+    waiter = asyncio.create_task(hold(0))
+    await asyncio.sleep(0)
+    assert admission.stats()["queue_depth"] == 1
+    try:
+        async with admission.slot():
+            assert False, "should have been rejected"
+    except OverloadedError:
+        pass
+    assert admission.rejected == 1
+    print("✅ Queue overflow: Rejected immediately")
+    
+    # Test 2: Queue time limit
+    try:
+        await waiter
+    except OverloadedError:
+        pass
+    assert admission.timed_out == 1
+    await holder
+    assert admission.stats()["in_flight"] == 0
+    print("✅ Queue timeout: Waiters give up after the limit")
+    
+    # Test 3: Shed requests fall back to a stale cache entry
+    import language_server
+    original = language_server.admission, language_server.result_cache, language_server.stale_served
+    language_server.admission = AdmissionController(max_in_flight=1, max_queue=0)
+    language_server.result_cache = ResultCache(ttl=0)
+    try:
+        key = ("synonyms", "happy", "en")
+        language_server.result_cache.put(key, WordRelations("happy", "synonyms", ["glad"]))
+        
+        async def lookup():
+            return WordRelations("happy", "synonyms", ["fresh"])
+        
+        holder = asyncio.create_task(language_server.admitted_lookup(("synonyms", "x", "en"), lambda: asyncio.sleep(0.1, WordRelations("x", "synonyms"))))
+        await asyncio.sleep(0)
+        served_before = language_server.stale_served
+        result = await language_server.admitted_lookup(key, lookup)
+        assert result.stale and result.words == ["glad"]
+        assert json.loads(encode(result))["stale"] is True
+        assert language_server.stale_served == served_before + 1
+        assert not language_server.result_cache.get(key)[0].stale
+        await holder
+    finally:
+        language_server.admission, language_server.result_cache, language_server.stale_served = original
+    print("✅ Load shedding: Stale cache served and flagged")
+    
+    print("🎉 All admission control tests passed!")
+    return True
+
+
+async def test_cli_parsing():
+    """Test parsing of interactive call commands."""
+    print("⌨️ Testing CLI Parsing...")
+    
+    from cli import parse_call
+    
+    # Test 1: Arguments, redirection and background flag
+    parsed = parse_call('call lang define {"word": "a > b"} >> out.txt &')
+    assert parsed == ("lang", "define", {"word": "a > b"}, True, "out.txt", "a")
+    print("✅ Full syntax: JSON, redirect and background parsed")
+    
+    # Test 2: Bare call
+    assert parse_call("call lang stats") == ("lang", "stats", {}, False, None, "w")
+    assert parse_call("call lang stats > out.txt") == ("lang", "stats", {}, False, "out.txt", "w")
+    print("✅ Bare call: Defaults applied")
+    
+    # Test 3: > and & inside the JSON are not redirects
+    parsed = parse_call('call lang define {"word": "a > b & c"}')
+    assert parsed == ("lang", "define", {"word": "a > b & c"}, False, None, "w")
+    print("✅ JSON operators: Left inside the arguments")
+    
+    # Test 4: Non-object arguments are rejected
+    try:
+        parse_call("call lang define [1]")
+        assert False, "list arguments accepted"
+    except ValueError:
+        pass
+    print("✅ Validation: Non-object arguments rejected")
+    
+    print("🎉 All CLI parsing tests passed!")
+    return True
+
+
+async def test_workflow_engine():
+    """Test workflow planning, templating and fan-out."""
+    print("🔀 Testing Workflow Engine...")
+    
+    # Test 1: Templates keep raw values for whole references
+    context = {"page": ["a", "b"], "item": "x"}
+    assert render({"rows": "{{page}}", "text": "{{ item }}!"}, context) == {"rows": ["a", "b"], "text": "x!"}
+    print("✅ Templating: Raw and interpolated references")
+    
+    # Test 2: Cycles are rejected up front
+    try:
+        WorkflowEngine(MCPClient(), [
+            WorkflowStep("a", "s", "t", {"x": "{{b}}"}),
+            WorkflowStep("b", "s", "t", {"x": "{{a}}"})
+        ])
+        assert False, "cycle not detected"
+    except ValueError:
+        pass
+    print("✅ Planning: Dependency cycles rejected")
+    
+    # Test 3: Fan-out over an earlier step's output
+    class EchoClient:
+        def __init__(self, fail_word=None, error_word=None):
+            self.fail_word = fail_word
+            self.error_word = error_word
+            self.calls = []
+        
+        async def call_tool(self, server_name, tool_name, arguments):
+            from mcp.types import TextContent
+            self.calls.append(arguments)
+            if self.fail_word and arguments.get("word") == self.fail_word:
+                return {"success": False, "error": "upstream down"}
+            if self.error_word and arguments.get("word") == self.error_word:
+                error = json.dumps({"error": "Unknown word"})
+                return {"success": False, "isError": True, "error": error,
+                        "result": [TextContent(type="text", text=error)]}
+            return {"success": True, "result": [TextContent(type="text", text=json.dumps(arguments))]}
+    
+    def pipeline(text):
+        return [
+            WorkflowStep("words", "s", "split", {"text": text}, transform=lambda out: out["text"].split()),
+            WorkflowStep("echo", "s", "echo", {"word": "{{item}}"}, for_each="{{words}}")
+        ]
+    
+    result = await WorkflowEngine(EchoClient(), pipeline("a b")).run()
+    assert result["outputs"]["echo"] == [{"word": "a"}, {"word": "b"}]
+    print("✅ Execution: Fan-out results collected")
+    
+    # Test 4: A failed run resumes without redoing finished work
+    import tempfile
+    tmp_dir = tempfile.TemporaryDirectory()
+    checkpoint = os.path.join(tmp_dir.name, "run.json")
+    failed = await WorkflowEngine(EchoClient(fail_word="c"), pipeline("a b c"), checkpoint_path=checkpoint).run()
+    assert not failed["success"] and failed["failed_step"] == "echo"
+    assert os.path.exists(checkpoint)
+    
+    resumed_client = EchoClient()
+    result = await WorkflowEngine(resumed_client, pipeline("a b c"), checkpoint_path=checkpoint).run()
+    assert result["outputs"]["echo"] == [{"word": "a"}, {"word": "b"}, {"word": "c"}]
+    assert resumed_client.calls == [{"word": "c"}]
+    assert not os.path.exists(checkpoint)
+    print("✅ Checkpointing: Resumed run only redoes the failed item")
+    
+    # Test 5: A checkpoint from different inputs is discarded
+    await WorkflowEngine(EchoClient(fail_word="c"), pipeline("a b c"), checkpoint_path=checkpoint).run()
+    result = await WorkflowEngine(EchoClient(), pipeline("x y"), checkpoint_path=checkpoint).run()
+    assert result["outputs"]["echo"] == [{"word": "x"}, {"word": "y"}]
+    print("✅ Checkpointing: Stale checkpoints ignored")
+    
+    # Test 6: Tool errors are failures, not checkpointed outputs
+    failed = await WorkflowEngine(EchoClient(error_word="b"), pipeline("a b"), checkpoint_path=checkpoint).run()
+    assert not failed["success"] and "Unknown word" in failed["error"]
+    resumed_client = EchoClient()
+    result = await WorkflowEngine(resumed_client, pipeline("a b"), checkpoint_path=checkpoint).run()
+    assert result["outputs"]["echo"] == [{"word": "a"}, {"word": "b"}]
+    assert resumed_client.calls == [{"word": "b"}]
+    print("✅ Checkpointing: isError results retried on resume")
+    
+    # Test 7: Fan-out progress is written in batches, not per item
+    class CountingEngine(WorkflowEngine):
+        writes = 0
+        
+        def _write_checkpoint(self):
+            self.writes += 1
+            super()._write_checkpoint()
+    
+    engine = CountingEngine(EchoClient(), pipeline(" ".join(["w"] * 50)), checkpoint_path=checkpoint,
+                            checkpoint_interval=60)
+    assert (await engine.run())["success"] and engine.writes == 2
+    tmp_dir.cleanup()
+    print("✅ Checkpointing: Fan-out saves throttled")
+    
+    print("🎉 All workflow tests passed!")
+    return True
+
+
+async def test_tracing():
+    """Test span nesting, propagation and sampling."""
+    print("🧭 Testing Tracing...")
+    
+    class ListExporter(list):
+        def export(self, span):
+            self.append(span)
+    
+    # Test 1: Child spans share the trace and link to their parent
+    exporter = ListExporter()
+    tracer = Tracer("test", exporter)
+    with tracer.span("parent") as parent:
+        with tracer.span("child"):
+            meta = tracer.inject()
+    child = exporter[0]
+    assert child.trace_id == parent.trace_id and child.parent_id == parent.span_id
+    assert parse_traceparent(meta["traceparent"])[:2] == (parent.trace_id, child.span_id)
+    print("✅ Nesting: Children linked to parents")
+    
+    # Test 2: Remote context is continued, including its sampling decision
+    remote = Tracer("remote", exporter)
+    with remote.span("server", traceparent=meta["traceparent"]) as server_span:
+        pass
+    assert server_span.parent_id == child.span_id
+    unsampled = f"00-{parent.trace_id}-{child.span_id}-00"
+    with remote.span("server", traceparent=unsampled):
+        pass
+    assert len(exporter) == 3
+    print("✅ Propagation: traceparent continued across processes")
+    
+    # Test 3: Sample rate zero records nothing
+    quiet = ListExporter()
+    with Tracer("test", quiet, sample_rate=0.0).span("root"):
+        pass
+    assert quiet == []
+    print("✅ Sampling: Unsampled traces not exported")
+    
+    # Test 4: OTLP spans are flushed on a timer, not only when a batch fills
+    class RecordingExporter(OTLPExporter):
+        batches = []
+        
+        async def flush(self):
+            spans, self._buffer = self._buffer, []
+            self.batches.append(spans)
+    
+    otlp = RecordingExporter("http://localhost:4318", flush_interval=0.05)
+    with Tracer("test", otlp).span("lonely"):
+        pass
+    await asyncio.sleep(0.1)
+    assert [[span.name for span in batch] for batch in otlp.batches] == [["lonely"]]
+    await otlp.shutdown()
+    print("✅ OTLP: Small batches flushed on an interval")
+    
+    # Test 5: Trace context crosses the stdio hop into language_server.py
+    import tempfile
+    tmp_dir = tempfile.TemporaryDirectory()
+    trace_file = os.path.join(tmp_dir.name, "traces.jsonl")
+    os.environ["MCP_TRACE_FILE"] = trace_file
+    try:
+        client = MCPClient()
+        assert await client.add_server(MCPServerConfig(name="language", command=sys.executable,
+                                                       args=[LANGUAGE_SERVER]))
+        await client.call_tool("language", "stats", {})
+        await client.call_tool("language", "no-such-tool", {})
+        await client.disconnect_all()
+    finally:
+        del os.environ["MCP_TRACE_FILE"]
+    
+    with open(trace_file, encoding="utf-8") as f:
+        spans = [json.loads(line) for line in f]
+    tmp_dir.cleanup()
+    client_spans = [span for span in spans if span["service"] == "mcp-client"]
+    server_spans = {span["name"]: span for span in spans if span["service"] == "language-tools"}
+    for client_span in client_spans:
+        server_span = server_spans[f"tools/call {client_span['attributes']['mcp.tool']}"]
+        assert server_span["trace_id"] == client_span["trace_id"]
+        assert server_span["parent_id"] == client_span["span_id"]
+    assert len(client_spans) == 2 and client_spans[1]["error"]
+    assert server_spans["tools/call stats"]["error"] is None
+    assert server_spans["tools/call no-such-tool"]["error"]
+    print("✅ End to end: Server spans join the client trace, errors marked on both sides")
+    
+    print("🎉 All tracing tests passed!")
+    return True
+
+
+async def test_hedging():
+    """Test hedged requests and the hedge budget."""
+    print("⏱️ Testing Request Hedging...")
+    
+    policy = HedgePolicy(default_delay=0.02, budget=0.3)
+    
+    async def slow():
+        await asyncio.sleep(1)
+        return "slow"
+    
+    async def fast():
+        return "fast"
+    
+    # Test 1: Slow primary is beaten by the hedge
+    assert await policy.run("tool", slow, fast) == "fast"
+    assert policy.stats()["hedged"] == 1 and policy.hedge_wins == 1
+    print("✅ Hedging: Backup wins when the primary stalls")
+    
+    # Test 2: Fast primary never hedges
+    assert await policy.run("tool", fast, slow) == "fast"
+    assert policy.hedged == 1
+    print("✅ Fast path: No extra request")
+    
+    # Test 3: Budget caps extra load
+    await policy.run("tool", lambda: asyncio.sleep(0.05, "primary"), fast)
+    assert policy.budget_denied == 1
+    print("✅ Budget: Hedges capped")
+    
+    # Test 4: Without a standby session the call is sent once, not hedged
+    class FakeSession:
+        def __init__(self, delay):
+            self.delay = delay
+            self._request_id = 0
+            self.cancelled = []
+        
+        async def send_request(self, request, result_type):
+            self._request_id += 1
+            await asyncio.sleep(self.delay)
+            return "done"
+        
+        async def send_notification(self, notification):
+            self.cancelled.append(notification.root.params.requestId)
+    
+    client = MCPClient(hedging=HedgePolicy(default_delay=0.02, budget=1.0))
+    session = FakeSession(0.05)
+    assert await client._hedged_call_tool("language", session, "define", {}) == "done"
+    assert client.hedging.no_backup == 1 and client.hedging.hedged == 0
+    print("✅ No standby: Call sent once and counted as no_backup")
+    
+    # Test 5: The losing request is cancelled on its server too
+    class FakeStandby:
+        session = FakeSession(0)
+    
+    client.supervisor.standbys["language"] = FakeStandby()
+    slow_session = FakeSession(1)
+    assert await client._hedged_call_tool("language", slow_session, "define", {}) == "done"
+    await asyncio.sleep(0.01)
+    assert client.hedging.hedge_wins == 1 and slow_session.cancelled == [0]
+    print("✅ Loser: notifications/cancelled sent for its request id")
+    
+    # Test 6: A backup GET is only sent when a slot is free right now
+    async def fetch_json(url):
+        await asyncio.sleep(0.05)
+        return 200, []
+    
+    admission = AdmissionController(max_in_flight=1, max_queue=4)
+    tools = LanguageTools(hedging=HedgePolicy(default_delay=0.02, budget=1.0), admission=admission)
+    tools._fetch_json = fetch_json
+    async with admission.slot():
+        result = await tools.get_synonyms("hello")
+    assert isinstance(result, WordRelations)
+    assert tools.hedging.hedged == 0 and tools.hedging.budget_denied == 1
+    assert admission.admitted == 1 and admission.rejected == 0 and admission.timed_out == 0
+    
+    admission = AdmissionController(max_in_flight=2, max_queue=4)
+    tools = LanguageTools(hedging=HedgePolicy(default_delay=0.02, budget=1.0), admission=admission)
+    tools._fetch_json = fetch_json
+    async with admission.slot():
+        await tools.get_synonyms("hello")
+    await asyncio.sleep(0.01)
+    assert tools.hedging.hedged == 1 and admission.admitted == 2 and admission.in_flight == 0
+    print("✅ Admission: Backup GETs never queue behind real requests")
+    
+    # Test 7: The budget covers recent requests, not the process lifetime
+    policy = HedgePolicy(default_delay=0.02, budget=0.1, window=10)
+    for _ in range(100):
+        await policy.run("tool", fast)
+    await policy.run("tool", slow, fast)
+    await policy.run("tool", slow, fast)
+    assert policy.hedged == 1 and policy.budget_denied == 1
+    print("✅ Budget: Quiet periods do not bank hedges")
+    
+    # Test 8: Only the primary's latency feeds the hedge delay
+    policy = HedgePolicy(default_delay=0.02, budget=1.0)
+    
+    async def failing():
+        await asyncio.sleep(0.03)
+        raise ConnectionError("primary failed")
+    
+    assert await policy.run("tool", failing, lambda: asyncio.sleep(0.05, "backup")) == "backup"
+    assert "tool" not in policy._latencies
+    assert await policy.run("tool", lambda: asyncio.sleep(0.05, "primary"), slow) == "primary"
+    assert list(policy._latencies["tool"]) >= [0.05]
+    print("✅ Latency: Primary latency recorded, failed primaries skipped")
+    
+    print("🎉 All hedging tests passed!")
+    return True
+
+
 async def run_tests():
     """Run all tests."""
     try:
         await test_client_basics()
+        await test_supervisor()
+        await test_language_models()
+        await test_language_server_errors()
+        await test_admission_control()
+        await test_cli_parsing()
+        await test_workflow_engine()
+        await test_tracing()
+        await test_hedging()
         print("\n🏆 All tests completed successfully!")
         return True
     except Exception as e:
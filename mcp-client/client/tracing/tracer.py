@@ -0,0 +1,249 @@
+"""
+Span-based tracing with W3C trace context propagation.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import aiohttp
+
+
+@dataclass(slots=True)
+class Span:
+    """A timed operation within a trace."""
+    name: str
+    service: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    sampled: bool = True
+    start_time: int = field(default_factory=time.time_ns)
+    end_time: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    
+    @property
+    def traceparent(self) -> str:
+        """W3C ``traceparent`` header value for this span."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+    
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+    
+    def record_error(self, error: BaseException | str):
+        self.error = str(error) or type(error).__name__
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "service": self.service,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_ms": ((self.end_time or self.start_time) - self.start_time) / 1e6,
+            "attributes": self.attributes,
+            "error": self.error
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """Parse a ``traceparent`` header into (trace_id, parent_span_id, sampled)."""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        flags = int(parts[3], 16)
+    except ValueError:
+        return None
+    return parts[1], parts[2], bool(flags & 1)
+
+
+class JsonlExporter:
+    """Appends finished spans to a local JSON Lines file."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+    
+    def export(self, span: Span):
+        self._file.write(json.dumps(span.to_dict()) + "\n")
+        self._file.flush()
+    
+    async def shutdown(self):
+        self._file.flush()
+
+
+class OTLPExporter:
+    """Batches spans and posts them to an OTLP/HTTP collector as JSON.
+    
+    A batch is sent when it reaches ``batch_size`` spans or ``flush_interval``
+    seconds after its first span, whichever comes first.
+    """
+    
+    def __init__(self, endpoint: str, batch_size: int = 64, flush_interval: float = 5.0):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: List[Span] = []
+        self._flushes: set = set()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.logger = logging.getLogger(__name__)
+    
+    def export(self, span: Span):
+        self._buffer.append(span)
+        if len(self._buffer) >= self.batch_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self._start_flush)
+    
+    def _start_flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+    
+    async def flush(self):
+        """Send buffered spans to the collector."""
+        spans, self._buffer = self._buffer, []
+        if not spans:
+            return
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(self.url, json=self._encode(spans)) as response:
+                    if response.status >= 400:
+                        self.logger.error(f"OTLP export failed with HTTP {response.status}")
+        except Exception as e:
+            self.logger.error(f"OTLP export failed: {e}")
+    
+    async def shutdown(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.flush()
+    
+    @staticmethod
+    def _encode(spans: List[Span]) -> Dict[str, Any]:
+        by_service: Dict[str, List[Dict[str, Any]]] = {}
+        for span in spans:
+            by_service.setdefault(span.service, []).append({
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "parentSpanId": span.parent_id or "",
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": str(span.start_time),
+                "endTimeUnixNano": str(span.end_time or span.start_time),
+                "attributes": [
+                    {"key": key, "value": {"stringValue": str(value)}}
+                    for key, value in span.attributes.items()
+                ],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1}
+            })
+        
+        return {"resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service}}]},
+                "scopeSpans": [{"scope": {"name": "mcp-client"}, "spans": otlp_spans}]
+            }
+            for service, otlp_spans in by_service.items()
+        ]}
+
+
+class Tracer:
+    """Creates spans and hands sampled ones to an exporter.
+    
+    Without an exporter spans are still created, so trace context keeps
+    flowing to downstream services, but nothing is recorded.
+    """
+    
+    def __init__(self, service: str, exporter=None, sample_rate: float = 1.0):
+        self.service = service
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+    
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None,
+             traceparent: Optional[str] = None) -> Iterator[Span]:
+        """Start a span as a child of the current span or of ``traceparent``."""
+        parent = _current_span.get()
+        remote = parse_traceparent(traceparent) if parent is None else None
+        
+        if parent is not None:
+            trace_id, parent_id, sampled = parent.trace_id, parent.span_id, parent.sampled
+        elif remote is not None:
+            trace_id, parent_id, sampled = remote
+        else:
+            trace_id, parent_id = f"{random.getrandbits(128):032x}", None
+            sampled = self.exporter is not None and random.random() < self.sample_rate
+        
+        span = Span(
+            name=name,
+            service=self.service,
+            trace_id=trace_id,
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent_id,
+            sampled=sampled,
+            attributes=dict(attributes or {})
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_time = time.time_ns()
+            if span.sampled and self.exporter is not None:
+                self.exporter.export(span)
+    
+    def inject(self) -> Dict[str, str]:
+        """Trace context of the current span, for a request's ``_meta``."""
+        span = _current_span.get()
+        return {"traceparent": span.traceparent} if span else {}
+    
+    async def shutdown(self):
+        """Flush any spans the exporter is still holding."""
+        if self.exporter is not None:
+            await self.exporter.shutdown()
+
+
+def tracer_from_env(service: str) -> Tracer:
+    """Build a tracer from the MCP_TRACE_* environment variables.
+    
+    MCP_TRACE_OTLP_ENDPOINT (with MCP_TRACE_FLUSH_INTERVAL) or MCP_TRACE_FILE
+    picks the exporter; MCP_TRACE_SAMPLE_RATE sets the sampling rate.
+    """
+    exporter = None
+    if os.environ.get("MCP_TRACE_OTLP_ENDPOINT"):
+        exporter = OTLPExporter(
+            os.environ["MCP_TRACE_OTLP_ENDPOINT"],
+            flush_interval=float(os.environ.get("MCP_TRACE_FLUSH_INTERVAL", "5.0"))
+        )
+    elif os.environ.get("MCP_TRACE_FILE"):
+        exporter = JsonlExporter(os.environ["MCP_TRACE_FILE"])
+    
+    return Tracer(service, exporter, float(os.environ.get("MCP_TRACE_SAMPLE_RATE", "1.0")))
+
+
+def trace_env() -> Dict[str, str]:
+    """MCP_TRACE_* settings to hand to child server processes."""
+    return {key: value for key, value in os.environ.items() if key.startswith("MCP_TRACE_")}
@@ -0,0 +1 @@
+# Workflow package
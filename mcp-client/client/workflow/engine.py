@@ -0,0 +1,257 @@
+"""
+Dependency-aware workflow executor for multi-server tool pipelines.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from client.core import MCPClient
+
+
+TEMPLATE_PATTERN = re.compile(r"\{\{\s*([\w.\-]+)\s*\}\}")
+
+
+@dataclass
+class WorkflowStep:
+    """A tool call in a workflow.
+    
+    String arguments may reference earlier outputs with ``{{step.path}}``;
+    a string that is a single reference is replaced by the raw value. With
+    ``for_each`` set to such a reference, the tool is called once per list
+    item, available as ``{{item}}``, and the step output is the list of results.
+    """
+    name: str
+    server: str
+    tool: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    depends_on: List[str] = field(default_factory=list)
+    for_each: Optional[str] = None
+    transform: Optional[Callable[[Any], Any]] = None
+
+
+def _references(value: Any) -> Set[str]:
+    """Step names referenced by templates inside a value."""
+    if isinstance(value, str):
+        return {match.split(".")[0] for match in TEMPLATE_PATTERN.findall(value)}
+    if isinstance(value, dict):
+        return set().union(*(_references(v) for v in value.values()))
+    if isinstance(value, list):
+        return set().union(*(_references(v) for v in value))
+    return set()
+
+
+def _lookup(path: str, context: Dict[str, Any]) -> Any:
+    value: Any = context
+    for key in path.split("."):
+        if isinstance(value, list):
+            value = value[int(key)]
+        elif isinstance(value, dict):
+            value = value[key]
+        else:
+            raise KeyError(f"Cannot resolve '{path}'")
+    return value
+
+
+def render(value: Any, context: Dict[str, Any]) -> Any:
+    """Substitute ``{{...}}`` references in a value from the context."""
+    if isinstance(value, str):
+        whole = TEMPLATE_PATTERN.fullmatch(value.strip())
+        if whole:
+            return _lookup(whole.group(1), context)
+        return TEMPLATE_PATTERN.sub(lambda m: str(_lookup(m.group(1), context)), value)
+    if isinstance(value, dict):
+        return {k: render(v, context) for k, v in value.items()}
+    if isinstance(value, list):
+        return [render(v, context) for v in value]
+    return value
+
+
+class WorkflowEngine:
+    """Runs a DAG of tool-call steps on top of MCPClient.
+    
+    Steps start as soon as their dependencies finish, limited per server by
+    ``server_limits`` (default ``default_limit``). With ``checkpoint_path``
+    set, finished steps and fan-out items are saved so a failed run can be
+    resumed without redoing them. Fan-out progress is written at most every
+    ``checkpoint_interval`` seconds; finished steps and failures are always
+    written. The checkpoint is tied to a fingerprint of the steps and is
+    removed once the run succeeds.
+    """
+    
+    def __init__(self, client: MCPClient, steps: List[WorkflowStep],
+                 server_limits: Optional[Dict[str, int]] = None, default_limit: int = 4,
+                 checkpoint_path: Optional[str] = None, checkpoint_interval: float = 1.0):
+        self.client = client
+        self.steps = {step.name: step for step in steps}
+        self.server_limits = server_limits or {}
+        self.default_limit = default_limit
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.logger = logging.getLogger(__name__)
+        
+        if len(self.steps) != len(steps):
+            raise ValueError("Workflow step names must be unique")
+        
+        self.dependencies = {
+            step.name: set(step.depends_on) | (_references([step.arguments, step.for_each]) - {"item"})
+            for step in steps
+        }
+        self.order = self._topological_order()
+        self.fingerprint = self._fingerprint()
+    
+    def _fingerprint(self) -> str:
+        """Hash of the step definitions, including their literal arguments."""
+        definition = []
+        for name in self.order:
+            step = self.steps[name]
+            definition.append({
+                "name": step.name,
+                "server": step.server,
+                "tool": step.tool,
+                "arguments": step.arguments,
+                "depends_on": sorted(self.dependencies[name]),
+                "for_each": step.for_each,
+                "transform": getattr(step.transform, "__qualname__", None)
+            })
+        encoded = json.dumps(definition, sort_keys=True, default=repr)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+    
+    def _topological_order(self) -> List[str]:
+        for name, deps in self.dependencies.items():
+            unknown = deps - set(self.steps)
+            if unknown:
+                raise ValueError(f"Step '{name}' depends on unknown steps: {sorted(unknown)}")
+        
+        order, done = [], set()
+        pending = dict(self.dependencies)
+        while pending:
+            ready = [name for name, deps in pending.items() if deps <= done]
+            if not ready:
+                raise ValueError(f"Workflow has a dependency cycle among: {sorted(pending)}")
+            for name in ready:
+                order.append(name)
+                done.add(name)
+                del pending[name]
+        return order
+    
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            if checkpoint.get("fingerprint") == self.fingerprint:
+                return checkpoint
+            self.logger.warning(f"Ignoring checkpoint {self.checkpoint_path}: workflow has changed")
+        return {"fingerprint": self.fingerprint, "steps": {}, "items": {}}
+    
+    def _save_checkpoint(self, force: bool = True):
+        if not self.checkpoint_path:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_save < self.checkpoint_interval:
+            return
+        self._last_save = now
+        self._write_checkpoint()
+    
+    def _write_checkpoint(self):
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+    
+    async def _call(self, step: WorkflowStep, arguments: Dict[str, Any]) -> Any:
+        async with self._semaphores[step.server]:
+            result = await self.client.call_tool(step.server, step.tool, arguments)
+        
+        if result.get("isError"):
+            raise RuntimeError(f"{step.server}.{step.tool} returned an error: {result.get('error')}")
+        if not result.get("success"):
+            raise RuntimeError(f"{step.server}.{step.tool} failed: {result.get('error')}")
+        
+        texts = [content.text for content in result["result"] if getattr(content, "text", None) is not None]
+        text = "\n".join(texts)
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text
+    
+    async def _run_step(self, step: WorkflowStep) -> Any:
+        await asyncio.gather(*(self._tasks[dep] for dep in self.dependencies[step.name]))
+        
+        if step.name in self._checkpoint["steps"]:
+            return self._checkpoint["steps"][step.name]
+        
+        context = self._checkpoint["steps"]
+        if step.for_each is None:
+            output = await self._call(step, render(step.arguments, context))
+        else:
+            items = render(step.for_each, context)
+            finished = self._checkpoint["items"].setdefault(step.name, {})
+            
+            async def run_item(index: int, item: Any) -> Any:
+                key = str(index)
+                if key not in finished:
+                    arguments = render(step.arguments, {**context, "item": item})
+                    finished[key] = await self._call(step, arguments)
+                    self._save_checkpoint(force=False)
+                return finished[key]
+            
+            output = list(await asyncio.gather(*(run_item(i, item) for i, item in enumerate(items))))
+        
+        if step.transform:
+            output = step.transform(output)
+        
+        self._checkpoint["steps"][step.name] = output
+        self._checkpoint["items"].pop(step.name, None)
+        self._save_checkpoint()
+        self.logger.info(f"Workflow step '{step.name}' finished")
+        return output
+    
+    async def run(self) -> Dict[str, Any]:
+        """Run the workflow, resuming from the checkpoint if there is one."""
+        self._checkpoint = self._load_checkpoint()
+        self._last_save = time.monotonic()
+        self._semaphores = {
+            step.server: asyncio.Semaphore(self.server_limits.get(step.server, self.default_limit))
+            for step in self.steps.values()
+        }
+        self._tasks: Dict[str, asyncio.Task] = {}
+        for name in self.order:
+            self._tasks[name] = asyncio.create_task(self._run_step(self.steps[name]))
+        
+        try:
+            await asyncio.gather(*self._tasks.values())
+        except asyncio.CancelledError:
+            self._save_checkpoint()
+            raise
+        except Exception as e:
+            for task in self._tasks.values():
+                task.cancel()
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+            self._save_checkpoint()
+            failed = next(
+                (name for name, task in self._tasks.items()
+                 if not task.cancelled() and task.exception() is e),
+                None
+            )
+            self.logger.error(f"Workflow failed at step '{failed}': {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "failed_step": failed,
+                "completed": list(self._checkpoint["steps"])
+            }
+        
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        
+        return {
+            "success": True,
+            "outputs": self._checkpoint["steps"]
+        }
@@ -6,6 +6,7 @@ Exposes define, synonyms, and antonyms as MCP tools
 
 import asyncio
 import json
+import os
 import sys
 from typing import Any, Sequence
 
@@ -22,13 +23,29 @@ from mcp.types import (
 import mcp.server.stdio
 import mcp.types as types
 
+from client.hedging.policy import HedgePolicy
+from client.language.admission import AdmissionController, OverloadedError
+from client.language.cache import ResultCache
+from client.language.models import LanguageResult, LanguageToolError, encode, mark_stale
 from client.language.tools import LanguageTools
+from client.tracing.tracer import tracer_from_env
 
 # Create server instance
 server = Server("language-tools")
 
-# Initialize language tools
-language_tools = LanguageTools()
+# Bound upstream load and keep results around to serve while shedding
+admission = AdmissionController(
+    max_in_flight=int(os.environ.get("LANGUAGE_MAX_IN_FLIGHT", "8")),
+    max_queue=int(os.environ.get("LANGUAGE_MAX_QUEUE", "32")),
+    max_queue_time=float(os.environ.get("LANGUAGE_MAX_QUEUE_TIME", "2.0"))
+)
+result_cache = ResultCache(ttl=float(os.environ.get("LANGUAGE_CACHE_TTL", "3600")))
+stale_served = 0
+
+# Initialize tracing and language tools; hedged backups take their own admission slot
+tracer = tracer_from_env("language-tools")
+hedging = HedgePolicy() if os.environ.get("LANGUAGE_HEDGING", "0") == "1" else None
+language_tools = LanguageTools(tracer, hedging, admission)
 
 @server.list_tools()
 async def handle_list_tools() -> list[Tool]:
@@ -48,6 +65,12 @@ async def handle_list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Language code (default: en)",
                         "default": "en"
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["json", "text"],
+                        "description": "Output format (default: json)",
+                        "default": "json"
                     }
                 },
                 "required": ["word"]
@@ -62,6 +85,12 @@ async def handle_list_tools() -> list[Tool]:
                     "word": {
                         "type": "string",
                         "description": "The word to find synonyms for"
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["json", "text"],
+                        "description": "Output format (default: json)",
+                        "default": "json"
                     }
                 },
                 "required": ["word"]
@@ -76,108 +105,119 @@ async def handle_list_tools() -> list[Tool]:
                     "word": {
                         "type": "string",
                         "description": "The word to find antonyms for"
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["json", "text"],
+                        "description": "Output format (default: json)",
+                        "default": "json"
                     }
                 },
                 "required": ["word"]
             }
+        ),
+        Tool(
+            name="stats",
+            description="Get server load: in-flight requests, queue depth and rejections",
+            inputSchema={
+                "type": "object",
+                "properties": {}
+            }
         )
     ]
 
-@server.call_tool()
-async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
-    """Handle tool calls."""
+def tool_result(result: LanguageResult, output_format: str) -> types.CallToolResult:
+    """Wrap a result as JSON (or rendered text), flagging errors with isError."""
+    text = result.render() if output_format == "text" else encode(result)
+    return types.CallToolResult(
+        content=[types.TextContent(type="text", text=text)],
+        isError=isinstance(result, LanguageToolError)
+    )
+
+async def handle_call_tool(name: str, arguments: dict[str, Any]) -> types.CallToolResult:
+    """Handle tool calls.
+
+    Results are returned as compact JSON by default; pass ``format: "text"``
+    for the human-readable rendering. Errors use the same format and set
+    ``isError`` on the result.
+    """
+    meta = server.request_context.meta
+    traceparent = getattr(meta, "traceparent", None) if meta else None
+    
+    with tracer.span(f"tools/call {name}", {"mcp.tool": name}, traceparent=traceparent) as span:
+        result = await dispatch_tool(name, arguments)
+        if result.isError:
+            span.record_error("tool returned an error")
+        return result
+
+async def dispatch_tool(name: str, arguments: dict[str, Any]) -> types.CallToolResult:
+    """Run a tool and wrap its result for the requested output format."""
+    output_format = arguments.get("format", "json")
     try:
-        if name == "define":
-            word = arguments.get("word", "")
-            language = arguments.get("language", "en")
-            
-            if not word:
-                return [types.TextContent(
-                    type="text",
-                    text="Error: Word parameter is required"
-                )]
-            
-            result = await language_tools.get_definition(word, language)
-            
-            if "error" in result:
-                return [types.TextContent(
-                    type="text",
-                    text=f"❌ {result['error']}"
-                )]
-            
-            # Format the definition response
-            response = f"📖 Definition for '{word}':\n"
-            if result.get("phonetics"):
-                response += f"🔊 Pronunciation: {', '.join(result['phonetics'])}\n"
-            
-            for def_item in result.get("definitions", []):
-                response += f"• {def_item['partOfSpeech']}: {def_item['definition']}\n"
-                if def_item.get('example'):
-                    response += f"  Example: {def_item['example']}\n"
-            
-            return [types.TextContent(type="text", text=response)]
-            
+        word = arguments.get("word", "")
+        language = arguments.get("language", "en")
+        
+        if name == "stats":
+            stats = {
+                **admission.stats(),
+                "cache_entries": len(result_cache),
+                "stale_served": stale_served,
+                "hedging": hedging.stats() if hedging else None
+            }
+            return types.CallToolResult(content=[types.TextContent(type="text", text=json.dumps(stats))])
+        elif name == "define":
+            lookup = lambda: language_tools.get_definition(word, language)
         elif name == "synonyms":
-            word = arguments.get("word", "")
-            
-            if not word:
-                return [types.TextContent(
-                    type="text",
-                    text="Error: Word parameter is required"
-                )]
-            
-            result = await language_tools.get_synonyms(word)
-            
-            if "error" in result:
-                return [types.TextContent(
-                    type="text",
-                    text=f"❌ {result['error']}"
-                )]
-            
-            response = f"🔄 Synonyms for '{word}':\n"
-            if result.get("synonyms"):
-                response += f"• {', '.join(result['synonyms'])}"
-            else:
-                response += "• No synonyms found"
-            
-            return [types.TextContent(type="text", text=response)]
-            
+            lookup = lambda: language_tools.get_synonyms(word)
         elif name == "antonyms":
-            word = arguments.get("word", "")
-            
-            if not word:
-                return [types.TextContent(
-                    type="text",
-                    text="Error: Word parameter is required"
-                )]
-            
-            result = await language_tools.get_antonyms(word)
-            
-            if "error" in result:
-                return [types.TextContent(
-                    type="text",
-                    text=f"❌ {result['error']}"
-                )]
-            
-            response = f"↔️ Antonyms for '{word}':\n"
-            if result.get("antonyms"):
-                response += f"• {', '.join(result['antonyms'])}"
-            else:
-                response += "• No antonyms found"
-            
-            return [types.TextContent(type="text", text=response)]
-            
+            lookup = lambda: language_tools.get_antonyms(word)
         else:
-            return [types.TextContent(
-                type="text",
-                text=f"Unknown tool: {name}"
-            )]
-            
+            return tool_result(LanguageToolError(f"Unknown tool: {name}"), output_format)
+        
+        if not word:
+            return tool_result(LanguageToolError("Word parameter is required"), output_format)
+        
+        result = await admitted_lookup((name, word.lower(), language), lookup)
+        return tool_result(result, output_format)
+    
     except Exception as e:
-        return [types.TextContent(
-            type="text",
-            text=f"Error: {str(e)}"
-        )]
+        return tool_result(LanguageToolError(str(e)), output_format)
+
+async def _call_tool_request(req: types.CallToolRequest) -> types.ServerResult:
+    return types.ServerResult(await handle_call_tool(req.params.name, req.params.arguments or {}))
+
+# Registered directly rather than with @server.call_tool(): the decorator in
+# mcp 1.9.3 always reports isError=False unless the handler raises.
+server.request_handlers[types.CallToolRequest] = _call_tool_request
+
+async def admitted_lookup(key, lookup):
+    """Run an upstream lookup under admission control.
+    
+    Fresh cached results skip the upstream call entirely. When the server is
+    overloaded, a stale cached result is served if there is one, flagged
+    with ``stale``.
+    """
+    global stale_served
+    
+    with tracer.span("cache.lookup") as span:
+        cached = result_cache.get(key)
+        span.set_attribute("cache.result", "miss" if not cached else "hit" if cached[1] else "stale")
+    if cached and cached[1]:
+        return cached[0]
+    
+    try:
+        with tracer.span("upstream", {"queue_depth": admission.queued}):
+            async with admission.slot():
+                result = await lookup()
+    except OverloadedError as e:
+        if cached:
+            stale_served += 1
+            return mark_stale(cached[0])
+        return LanguageToolError(f"Server overloaded: {e}")
+    
+    if not isinstance(result, LanguageToolError):
+        result_cache.put(key, result)
+    return result
 
 async def main():
     """Run the server."""
@@ -187,6 +227,7 @@ async def main():
             write_stream,
             server.create_initialization_options()
         )
+    await tracer.shutdown()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -51,38 +51,21 @@ async def main():
             from client.language.tools import LanguageTools
             tools = LanguageTools()
             result = await tools.get_definition(word, lang)
-            print(f"📖 Definition for '{word}':")
-            if "error" in result:
-                print(f"❌ {result['error']}")
-            else:
-                if result.get("phonetics"):
-                    print(f"🔊 Pronunciation: {', '.join(result['phonetics'])}")
-                for def_item in result.get("definitions", []):
-                    print(f"• {def_item['partOfSpeech']}: {def_item['definition']}")
-                    if def_item.get('example'):
-                        print(f"  Example: {def_item['example']}")
+            print(result.render())
         elif command == "synonyms":
             # Get synonyms
             word = sys.argv[2] if len(sys.argv) > 2 else input("Enter word: ")
             from client.language.tools import LanguageTools
             tools = LanguageTools()
             result = await tools.get_synonyms(word)
-            print(f"🔄 Synonyms for '{word}':")
-            if "error" in result:
-                print(f"❌ {result['error']}")
-            else:
-                print(f"• {', '.join(result['synonyms'])}")
+            print(result.render())
         elif command == "antonyms":
             # Get antonyms
             word = sys.argv[2] if len(sys.argv) > 2 else input("Enter word: ")
             from client.language.tools import LanguageTools
             tools = LanguageTools()
             result = await tools.get_antonyms(word)
-            print(f"↔️ Antonyms for '{word}':")
-            if "error" in result:
-                print(f"❌ {result['error']}")
-            else:
-                print(f"• {', '.join(result['antonyms'])}")
+            print(result.render())
         else:
             print(f"Unknown command: {command}")
             print("Available commands: status, test, demo, define, synonyms, antonyms")